@@ -161,6 +161,28 @@ class OpenSearchBM25Retriever:
         fuzziness: Optional[Union[str, int]],
         scale_score: Optional[bool],
         custom_query: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        return {
+            "query": query,
+            **self._resolve_bm25_params(
+                filters=filters,
+                all_terms_must_match=all_terms_must_match,
+                top_k=top_k,
+                fuzziness=fuzziness,
+                scale_score=scale_score,
+                custom_query=custom_query,
+            ),
+        }
+
+    def _resolve_bm25_params(
+        self,
+        *,
+        filters: Optional[Dict[str, Any]],
+        all_terms_must_match: Optional[bool],
+        top_k: Optional[int],
+        fuzziness: Optional[Union[str, int]],
+        scale_score: Optional[bool],
+        custom_query: Optional[Dict[str, Any]],
     ) -> Dict[str, Any]:
         filters = apply_filter_policy(self._filter_policy, self._filters, filters)
 
@@ -178,7 +200,6 @@ class OpenSearchBM25Retriever:
             custom_query = self._custom_query
 
         return {
-            "query": query,
             "filters": filters,
             "fuzziness": fuzziness,
             "top_k": top_k,
@@ -276,6 +297,51 @@ class OpenSearchBM25Retriever:
 
         return {"documents": docs}
 
+    def run_batch(
+        self,
+        queries: List[str],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        all_terms_must_match: Optional[bool] = None,
+        top_k: Optional[int] = None,
+        fuzziness: Optional[Union[int, str]] = None,
+        scale_score: Optional[bool] = None,
+        custom_query: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Retrieve documents for several queries with a single request to OpenSearch.
+
+        The same retrieval parameters are applied to every query. See `run()` for a description of the parameters.
+
+        :param queries: The query strings.
+        :returns:
+            A dictionary containing one list of retrieved Documents per query, in the same order as `queries`.
+        """
+        docs: List[List[Document]] = []
+
+        bm25_args = self._resolve_bm25_params(
+            filters=filters,
+            all_terms_must_match=all_terms_must_match,
+            top_k=top_k,
+            fuzziness=fuzziness,
+            scale_score=scale_score,
+            custom_query=custom_query,
+        )
+
+        try:
+            docs = self._document_store._bm25_retrieval_batch(queries=queries, **bm25_args)
+        except Exception as e:
+            if self._raise_on_failure:
+                raise e
+            logger.warning(
+                "An error during BM25 retrieval occurred and will be ignored by returning empty results: {error}",
+                error=str(e),
+                exc_info=True,
+            )
+            docs = [[] for _ in queries]
+
+        return {"documents": docs}
+
     @component.output_types(documents=List[Document])
     async def run_async(  # pylint: disable=too-many-positional-arguments
         self,
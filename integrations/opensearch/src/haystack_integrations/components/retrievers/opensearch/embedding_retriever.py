@@ -4,12 +4,14 @@
 
 from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
 from haystack import component, default_from_dict, default_to_dict, logging
 from haystack.dataclasses import Document
 from haystack.document_stores.types import FilterPolicy
 from haystack.document_stores.types.filter_policy import apply_filter_policy
 
 from haystack_integrations.document_stores.opensearch import OpenSearchDocumentStore
+from haystack_integrations.document_stores.opensearch.document_store import QueryEmbedding
 
 logger = logging.getLogger(__name__)
 
@@ -144,10 +146,36 @@ class OpenSearchEmbeddingRetriever:
             data["init_parameters"]["filter_policy"] = FilterPolicy.from_str(data["init_parameters"]["filter_policy"])
         return default_from_dict(cls, data)
 
+    def _prepare_embedding_args(
+        self,
+        *,
+        filters: Optional[Dict[str, Any]],
+        top_k: Optional[int],
+        custom_query: Optional[Dict[str, Any]],
+        efficient_filtering: Optional[bool],
+    ) -> Dict[str, Any]:
+        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+        top_k = top_k or self._top_k
+        if filters is None:
+            filters = self._filters
+        if top_k is None:
+            top_k = self._top_k
+        if custom_query is None:
+            custom_query = self._custom_query
+        if efficient_filtering is None:
+            efficient_filtering = self._efficient_filtering
+
+        return {
+            "filters": filters,
+            "top_k": top_k,
+            "custom_query": custom_query,
+            "efficient_filtering": efficient_filtering,
+        }
+
     @component.output_types(documents=List[Document])
     def run(
         self,
-        query_embedding: List[float],
+        query_embedding: QueryEmbedding,
         filters: Optional[Dict[str, Any]] = None,
         top_k: Optional[int] = None,
         custom_query: Optional[Dict[str, Any]] = None,
@@ -156,7 +184,7 @@ class OpenSearchEmbeddingRetriever:
         """
         Retrieve documents using a vector similarity metric.
 
-        :param query_embedding: Embedding of the query.
+        :param query_embedding: Embedding of the query, as a list of floats or a NumPy array.
         :param filters: Filters applied when fetching documents from the Document Store.
             Filters are applied during the approximate kNN search to ensure the Retriever
               returns `top_k` matching documents.
@@ -209,27 +237,17 @@ class OpenSearchEmbeddingRetriever:
             Dictionary with key "documents" containing the retrieved Documents.
             - documents: List of Document similar to `query_embedding`.
         """
-        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
-        top_k = top_k or self._top_k
-        if filters is None:
-            filters = self._filters
-        if top_k is None:
-            top_k = self._top_k
-        if custom_query is None:
-            custom_query = self._custom_query
-        if efficient_filtering is None:
-            efficient_filtering = self._efficient_filtering
+        embedding_args = self._prepare_embedding_args(
+            filters=filters,
+            top_k=top_k,
+            custom_query=custom_query,
+            efficient_filtering=efficient_filtering,
+        )
 
         docs: List[Document] = []
 
         try:
-            docs = self._document_store._embedding_retrieval(
-                query_embedding=query_embedding,
-                filters=filters,
-                top_k=top_k,
-                custom_query=custom_query,
-                efficient_filtering=efficient_filtering,
-            )
+            docs = self._document_store._embedding_retrieval(query_embedding=query_embedding, **embedding_args)
         except Exception as e:
             if self._raise_on_failure:
                 raise e
@@ -243,10 +261,53 @@ class OpenSearchEmbeddingRetriever:
 
         return {"documents": docs}
 
+    def run_batch(
+        self,
+        query_embeddings: Union[List[QueryEmbedding], np.ndarray],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: Optional[int] = None,
+        custom_query: Optional[Dict[str, Any]] = None,
+        efficient_filtering: Optional[bool] = None,
+    ) -> Dict[str, List[List[Document]]]:
+        """
+        Retrieve documents for several query embeddings with a single request to OpenSearch.
+
+        The same `filters`, `top_k`, `custom_query` and `efficient_filtering` are applied to every query.
+        See `run()` for a description of the parameters.
+
+        :param query_embeddings: Embeddings of the queries, as a list of embeddings or a 2D NumPy array.
+        :returns:
+            Dictionary with key "documents" containing one list of retrieved Documents per query embedding,
+            in the same order as `query_embeddings`.
+        """
+        embedding_args = self._prepare_embedding_args(
+            filters=filters,
+            top_k=top_k,
+            custom_query=custom_query,
+            efficient_filtering=efficient_filtering,
+        )
+
+        docs: List[List[Document]] = []
+
+        try:
+            docs = self._document_store._embedding_retrieval_batch(query_embeddings=query_embeddings, **embedding_args)
+        except Exception as e:
+            if self._raise_on_failure:
+                raise e
+            logger.warning(
+                "An error during embedding retrieval occurred and will be ignored by returning empty results: {error}",
+                error=str(e),
+                exc_info=True,
+            )
+            docs = [[] for _ in query_embeddings]
+
+        return {"documents": docs}
+
     @component.output_types(documents=List[Document])
     async def run_async(
         self,
-        query_embedding: List[float],
+        query_embedding: QueryEmbedding,
         filters: Optional[Dict[str, Any]] = None,
         top_k: Optional[int] = None,
         custom_query: Optional[Dict[str, Any]] = None,
@@ -255,7 +316,7 @@ class OpenSearchEmbeddingRetriever:
         """
         Asynchronously retrieve documents using a vector similarity metric.
 
-        :param query_embedding: Embedding of the query.
+        :param query_embedding: Embedding of the query, as a list of floats or a NumPy array.
         :param filters: Filters applied when fetching documents from the Document Store.
             Filters are applied during the approximate kNN search to ensure the Retriever
               returns `top_k` matching documents.
@@ -308,26 +369,18 @@ class OpenSearchEmbeddingRetriever:
             Dictionary with key "documents" containing the retrieved Documents.
             - documents: List of Document similar to `query_embedding`.
         """
-        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
-        top_k = top_k or self._top_k
-        if filters is None:
-            filters = self._filters
-        if top_k is None:
-            top_k = self._top_k
-        if custom_query is None:
-            custom_query = self._custom_query
-        if efficient_filtering is None:
-            efficient_filtering = self._efficient_filtering
+        embedding_args = self._prepare_embedding_args(
+            filters=filters,
+            top_k=top_k,
+            custom_query=custom_query,
+            efficient_filtering=efficient_filtering,
+        )
 
         docs: List[Document] = []
 
         try:
             docs = await self._document_store._embedding_retrieval_async(
-                query_embedding=query_embedding,
-                filters=filters,
-                top_k=top_k,
-                custom_query=custom_query,
-                efficient_filtering=efficient_filtering,
+                query_embedding=query_embedding, **embedding_args
             )
         except Exception as e:
             if self._raise_on_failure:
@@ -1,10 +1,13 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
-
+import copy
+import threading
+from collections import OrderedDict
 from math import exp
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
 
+import numpy as np
 from haystack import default_from_dict, default_to_dict, logging
 from haystack.dataclasses import Document
 from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumentError
@@ -15,11 +18,19 @@ from opensearchpy.helpers import async_bulk, bulk
 
 from haystack_integrations.document_stores.opensearch.auth import AsyncAWSAuth, AWSAuth
 from haystack_integrations.document_stores.opensearch.filters import normalize_filters
+from haystack_integrations.document_stores.opensearch.query_cache import (
+    DEFAULT_CACHE_CONFIG,
+    QueryCache,
+    is_deterministic_query,
+)
 
 logger = logging.getLogger(__name__)
 
 Hosts = Union[str, List[Union[str, Mapping[str, Union[str, int]]]]]
 
+# Query embeddings can be passed as NumPy arrays, they are converted to lists once when the request is serialized
+QueryEmbedding = Union[List[float], np.ndarray]
+
 # document scores are essentially unbounded and will be scaled to values between 0 and 1 if scale_score is set to
 # True. Scaling uses the expit function (inverse of the logit function) after applying a scaling factor
 # (e.g., BM25_SCALING_FACTOR for the bm25_retrieval method).
@@ -32,6 +43,101 @@ BM25_SCALING_FACTOR = 8
 DEFAULT_SETTINGS = {"index.knn": True}
 DEFAULT_MAX_CHUNK_BYTES = 100 * 1024 * 1024
 
+# Location of a placeholder inside a custom query, as the sequence of keys and list indices leading to it
+CustomQueryPath = Tuple[Union[str, int], ...]
+
+
+class CompiledCustomQuery(NamedTuple):
+    """
+    A custom query prepared for rendering, see `_compile_custom_query`.
+    """
+
+    template: Dict[str, Any]
+    placeholder_paths: Dict[str, List[CustomQueryPath]]
+    deterministic: bool
+
+
+# Maximum number of compiled custom queries kept by `_compile_custom_query`
+CUSTOM_QUERY_CACHE_SIZE = 128
+_compiled_custom_queries: OrderedDict[int, Tuple[Any, str, CompiledCustomQuery]] = OrderedDict()
+_compiled_custom_queries_lock = threading.Lock()
+
+
+def _copy_path(
+    rendered: Dict[str, Any], path: CustomQueryPath, copied: Dict[CustomQueryPath, Any]
+) -> Union[Dict[str, Any], List[Any]]:
+    """
+    Copies the containers leading to `path` in a rendered custom query and returns the parent of its last element.
+
+    `rendered` starts out as a shallow copy of the template, so its containers are shared with the template until
+    they are copied here. `copied` keeps track of the containers that were copied already.
+    """
+    node: Any = rendered
+    for depth in range(1, len(path)):
+        prefix = path[:depth]
+        child = copied.get(prefix)
+        if child is None:
+            child = copy.copy(node[path[depth - 1]])
+            node[path[depth - 1]] = child
+            copied[prefix] = child
+        node = child
+    return node
+
+
+def _collect_placeholder_paths(
+    node: Any, path: CustomQueryPath, placeholder_paths: Dict[str, List[CustomQueryPath]]
+) -> None:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            _collect_placeholder_paths(value, (*path, key), placeholder_paths)
+    elif isinstance(node, list):
+        for i, entry in enumerate(node):
+            _collect_placeholder_paths(entry, (*path, i), placeholder_paths)
+    elif isinstance(node, str) and node.startswith("$"):
+        placeholder_paths.setdefault(node, []).append(path)
+
+
+def _compile_custom_query(custom_query: Dict[str, Any]) -> CompiledCustomQuery:
+    """
+    Finds the locations of all placeholders in a custom query and checks whether its results can be cached.
+
+    Custom queries are usually reused for many searches, so the result is cached.
+    The returned template is a snapshot of `custom_query` and must not be modified, rendered queries share
+    all parts without placeholders with it.
+
+    :param custom_query: The custom query to compile.
+    :returns: The template, the paths of each placeholder found in it, and whether the query is deterministic.
+    """
+    # The fingerprint detects modifications made since the query was compiled. Unlike comparing with `==`,
+    # it tells apart values such as 1, 1.0 and True and supports NumPy arrays.
+    try:
+        fingerprint = QueryCache.make_key(custom_query)
+    except TypeError:
+        fingerprint = None
+
+    with _compiled_custom_queries_lock:
+        cached = _compiled_custom_queries.get(id(custom_query))
+    # Holding a reference to the custom query keeps its id from being reused
+    if cached is not None and cached[0] is custom_query and cached[1] == fingerprint:
+        return cached[2]
+
+    template = copy.deepcopy(custom_query)
+    placeholder_paths: Dict[str, List[CustomQueryPath]] = {}
+    _collect_placeholder_paths(template, (), placeholder_paths)
+    compiled = CompiledCustomQuery(template, placeholder_paths, is_deterministic_query(template))
+    if fingerprint is None:
+        # Queries containing values that can't be fingerprinted are compiled on every use
+        return compiled
+
+    # The cache is shared by all document stores, which can be used from several threads
+    with _compiled_custom_queries_lock:
+        _compiled_custom_queries[id(custom_query)] = (custom_query, fingerprint, compiled)
+        _compiled_custom_queries.move_to_end(id(custom_query))
+        while len(_compiled_custom_queries) > CUSTOM_QUERY_CACHE_SIZE:
+            # Evict the oldest entry
+            _compiled_custom_queries.popitem(last=False)
+    return compiled
+
 
 class OpenSearchDocumentStore:
     """
@@ -81,6 +187,7 @@ class OpenSearchDocumentStore:
         use_ssl: Optional[bool] = None,
         verify_certs: Optional[bool] = None,
         timeout: Optional[int] = None,
+        cache_config: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -118,6 +225,13 @@ class OpenSearchDocumentStore:
         :param use_ssl: Whether to use SSL. Defaults to None
         :param verify_certs: Whether to verify certificates. Defaults to None
         :param timeout: Timeout in seconds. Defaults to None
+        :param cache_config: Configuration of the in-memory cache for the results of BM25 and embedding retrieval.
+            Supported keys are `enabled`, `max_size` (maximum number of cached results), and `ttl_seconds`
+            (seconds after which a cached result expires). Missing keys use the defaults
+            {"enabled": False, "max_size": 2000, "ttl_seconds": 300}.
+            The cache is invalidated when documents are written or deleted through this instance. Changes made to
+            the index by other clients are only picked up once the cached results expire.
+            Defaults to None, which disables the cache
         :param **kwargs: Optional arguments that ``OpenSearch`` takes. For the full list of supported kwargs,
             see the [official OpenSearch reference](https://opensearch-project.github.io/opensearch-py/api-ref/clients/opensearch_client.html)
         """
@@ -145,8 +259,30 @@ class OpenSearchDocumentStore:
         self._use_ssl = use_ssl
         self._verify_certs = verify_certs
         self._timeout = timeout
+        self._cache_config = cache_config
         self._kwargs = kwargs
 
+        unknown_cache_keys = set(cache_config or {}) - set(DEFAULT_CACHE_CONFIG)
+        if unknown_cache_keys:
+            msg = f"Unknown cache_config keys: {', '.join(sorted(unknown_cache_keys))}"
+            raise ValueError(msg)
+        resolved_cache_config = {**DEFAULT_CACHE_CONFIG, **(cache_config or {})}
+        max_size = resolved_cache_config["max_size"]
+        if isinstance(max_size, bool) or not isinstance(max_size, int) or max_size <= 0:
+            msg = f"cache_config max_size must be a positive integer, got {max_size!r}"
+            raise ValueError(msg)
+        ttl_seconds = resolved_cache_config["ttl_seconds"]
+        if isinstance(ttl_seconds, bool) or not isinstance(ttl_seconds, (int, float)) or ttl_seconds < 0:
+            msg = f"cache_config ttl_seconds must be a non-negative number, got {ttl_seconds!r}"
+            raise ValueError(msg)
+        self._query_cache: Optional[QueryCache] = None
+        if resolved_cache_config["enabled"]:
+            self._query_cache = QueryCache(
+                max_size=resolved_cache_config["max_size"], ttl_seconds=resolved_cache_config["ttl_seconds"]
+            )
+        # Part of every cache key, bumped whenever documents are written or deleted so older results are never served
+        self._index_version = 0
+
         # Client is initialized lazily to prevent side effects when
         # the document store is instantiated.
         self._client: Optional[OpenSearch] = None
@@ -237,6 +373,7 @@ class OpenSearchDocumentStore:
             use_ssl=self._use_ssl,
             verify_certs=self._verify_certs,
             timeout=self._timeout,
+            cache_config=self._cache_config,
             **self._kwargs,
         )
 
@@ -301,6 +438,41 @@ class OpenSearchDocumentStore:
             body = {"mappings": self._mappings, "settings": self._settings}
             self._client.indices.create(index=self._index, body=body)
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Returns statistics about the retrieval results cache.
+
+        :returns: A dictionary with the keys `enabled`, `hits`, `misses`, `evictions`, `size`, and `max_size`.
+        """
+        if self._query_cache is None:
+            return {"enabled": False, "hits": 0, "misses": 0, "evictions": 0, "size": 0, "max_size": 0}
+        return {"enabled": True, **self._query_cache.stats()}
+
+    def _get_query_cache_key(self, **search_params: Any) -> Optional[str]:
+        """
+        Returns the key to cache the results of a search with, or None if they must not be cached.
+        """
+        if self._query_cache is None:
+            return None
+        custom_query = search_params.get("custom_query")
+        if custom_query is not None and not _compile_custom_query(custom_query).deterministic:
+            return None
+        try:
+            return QueryCache.make_key(self._index, self._index_version, search_params)
+        except TypeError as e:
+            # The search itself may still succeed, the OpenSearch client serializes more types than the cache key
+            logger.debug("Not caching search results, no cache key can be built: {error}", error=str(e))
+            return None
+
+    def _get_cached_documents(self, cache_key: Optional[str]) -> Optional[List[Document]]:
+        if cache_key is None or self._query_cache is None:
+            return None
+        return self._query_cache.get(cache_key)
+
+    def _cache_documents(self, cache_key: Optional[str], documents: List[Document]) -> None:
+        if cache_key is not None and self._query_cache is not None:
+            self._query_cache.put(cache_key, documents)
+
     def count_documents(self) -> int:
         """
         Returns how many documents are present in the document store.
@@ -351,6 +523,30 @@ class OpenSearchDocumentStore:
         search_results = await self._async_client.search(index=self._index, body=request_body)
         return self._deserialize_search_hits(search_results["hits"]["hits"])
 
+    def _prepare_msearch_request(self, request_bodies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # The multi search API expects header and body lines to alternate
+        msearch_body: List[Dict[str, Any]] = []
+        for request_body in request_bodies:
+            msearch_body.append({"index": self._index})
+            msearch_body.append(request_body)
+        return msearch_body
+
+    def _deserialize_msearch_responses(self, responses: List[Dict[str, Any]]) -> List[List[Document]]:
+        out = []
+        for response in responses:
+            if "error" in response:
+                msg = f"Failed to retrieve documents from OpenSearch. Error:\n{response['error']}"
+                raise DocumentStoreError(msg)
+            out.append(self._deserialize_search_hits(response["hits"]["hits"]))
+        return out
+
+    def _msearch_documents(self, request_bodies: List[Dict[str, Any]]) -> List[List[Document]]:
+        assert self._client is not None
+        if not request_bodies:
+            return []
+        search_results = self._client.msearch(body=self._prepare_msearch_request(request_bodies))
+        return self._deserialize_msearch_responses(search_results["responses"])
+
     def filter_documents(self, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
         Returns the documents that match the filters provided.
@@ -461,6 +657,7 @@ class OpenSearchDocumentStore:
 
         bulk_params = self._prepare_bulk_write_request(documents=documents, policy=policy, is_async=False)
         documents_written, errors = bulk(**bulk_params)
+        self._index_version += 1
         self._process_bulk_write_errors(errors, policy)
         return documents_written
 
@@ -477,6 +674,7 @@ class OpenSearchDocumentStore:
         self._ensure_initialized()
         bulk_params = self._prepare_bulk_write_request(documents=documents, policy=policy, is_async=True)
         documents_written, errors = await async_bulk(**bulk_params)
+        self._index_version += 1
         # since we call async_bulk with stats_only=False, errors is guaranteed to be a list (not int)
         self._process_bulk_write_errors(errors=errors, policy=policy)  # type: ignore[arg-type]
         return documents_written
@@ -514,6 +712,7 @@ class OpenSearchDocumentStore:
         self._ensure_initialized()
 
         bulk(**self._prepare_bulk_delete_request(document_ids=document_ids, is_async=False))
+        self._index_version += 1
 
     async def delete_documents_async(self, document_ids: List[str]) -> None:
         """
@@ -524,6 +723,7 @@ class OpenSearchDocumentStore:
         self._ensure_initialized()
 
         await async_bulk(**self._prepare_bulk_delete_request(document_ids=document_ids, is_async=True))
+        self._index_version += 1
 
     def _prepare_bm25_search_request(
         self,
@@ -535,19 +735,9 @@ class OpenSearchDocumentStore:
         all_terms_must_match: bool,
         custom_query: Optional[Dict[str, Any]],
     ) -> Dict[str, Any]:
-        if not query:
-            body: Dict[str, Any] = {"query": {"bool": {"must": {"match_all": {}}}}}
-            if filters:
-                body["query"]["bool"]["filter"] = normalize_filters(filters)
-
+        body: Dict[str, Any]
         if isinstance(custom_query, dict):
-            body = self._render_custom_query(
-                custom_query,
-                {
-                    "$query": query,
-                    "$filters": normalize_filters(filters) if filters else None,
-                },
-            )
+            body = self._render_custom_query(custom_query, {"$query": query}, filters=filters)
 
         else:
             operator = "AND" if all_terms_must_match else "OR"
@@ -615,6 +805,19 @@ class OpenSearchDocumentStore:
         """
         self._ensure_initialized()
 
+        cache_key = self._get_query_cache_key(
+            retrieval="bm25",
+            query=query,
+            filters=filters,
+            fuzziness=fuzziness,
+            top_k=top_k,
+            scale_score=scale_score,
+            all_terms_must_match=all_terms_must_match,
+            custom_query=custom_query,
+        )
+        if (cached_documents := self._get_cached_documents(cache_key)) is not None:
+            return cached_documents
+
         search_params = self._prepare_bm25_search_request(
             query=query,
             filters=filters,
@@ -625,8 +828,51 @@ class OpenSearchDocumentStore:
         )
         documents = self._search_documents(search_params)
         self._postprocess_bm25_search_results(results=documents, scale_score=scale_score)
+
+        self._cache_documents(cache_key, documents)
         return documents
 
+    def _bm25_retrieval_batch(
+        self,
+        queries: List[str],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        fuzziness: Union[int, str] = "AUTO",
+        top_k: int = 10,
+        scale_score: bool = False,
+        all_terms_must_match: bool = False,
+        custom_query: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Document]]:
+        """
+        Retrieves documents for each of the provided `queries` using the BM25 search algorithm.
+
+        All queries are sent to OpenSearch in a single multi search request.
+        The results are returned in the same order as `queries`.
+
+        This method is not meant to be part of the public interface of
+        `OpenSearchDocumentStore` nor called directly.
+        `OpenSearchBM25Retriever` uses this method directly and is the public interface for it.
+
+        See `OpenSearchBM25Retriever` for more information.
+        """
+        self._ensure_initialized()
+
+        request_bodies = [
+            self._prepare_bm25_search_request(
+                query=query,
+                filters=filters,
+                fuzziness=fuzziness,
+                top_k=top_k,
+                all_terms_must_match=all_terms_must_match,
+                custom_query=custom_query,
+            )
+            for query in queries
+        ]
+        results = self._msearch_documents(request_bodies)
+        for documents in results:
+            self._postprocess_bm25_search_results(results=documents, scale_score=scale_score)
+        return results
+
     async def _bm25_retrieval_async(
         self,
         query: str,
@@ -654,6 +900,19 @@ class OpenSearchDocumentStore:
 
         self._ensure_initialized()
 
+        cache_key = self._get_query_cache_key(
+            retrieval="bm25",
+            query=query,
+            filters=filters,
+            fuzziness=fuzziness,
+            top_k=top_k,
+            scale_score=scale_score,
+            all_terms_must_match=all_terms_must_match,
+            custom_query=custom_query,
+        )
+        if (cached_documents := self._get_cached_documents(cache_key)) is not None:
+            return cached_documents
+
         search_params = self._prepare_bm25_search_request(
             query=query,
             filters=filters,
@@ -664,30 +923,26 @@ class OpenSearchDocumentStore:
         )
         documents = await self._search_documents_async(search_params)
         self._postprocess_bm25_search_results(results=documents, scale_score=scale_score)
+
+        self._cache_documents(cache_key, documents)
         return documents
 
     def _prepare_embedding_search_request(
         self,
         *,
-        query_embedding: List[float],
+        query_embedding: QueryEmbedding,
         filters: Optional[Dict[str, Any]],
         top_k: int,
         custom_query: Optional[Dict[str, Any]],
         efficient_filtering: bool = False,
     ) -> Dict[str, Any]:
-        if not query_embedding:
+        if query_embedding is None or len(query_embedding) == 0:
             msg = "query_embedding must be a non-empty list of floats"
             raise ValueError(msg)
 
         body: Dict[str, Any]
         if isinstance(custom_query, dict):
-            body = self._render_custom_query(
-                custom_query,
-                {
-                    "$query_embedding": query_embedding,
-                    "$filters": normalize_filters(filters) if filters else None,
-                },
-            )
+            body = self._render_custom_query(custom_query, {"$query_embedding": query_embedding}, filters=filters)
 
         else:
             body = {
@@ -724,7 +979,7 @@ class OpenSearchDocumentStore:
 
     def _embedding_retrieval(
         self,
-        query_embedding: List[float],
+        query_embedding: QueryEmbedding,
         *,
         filters: Optional[Dict[str, Any]] = None,
         top_k: int = 10,
@@ -743,6 +998,17 @@ class OpenSearchDocumentStore:
         """
         self._ensure_initialized()
 
+        cache_key = self._get_query_cache_key(
+            retrieval="embedding",
+            query_embedding=query_embedding,
+            filters=filters,
+            top_k=top_k,
+            custom_query=custom_query,
+            efficient_filtering=efficient_filtering,
+        )
+        if (cached_documents := self._get_cached_documents(cache_key)) is not None:
+            return cached_documents
+
         search_params = self._prepare_embedding_search_request(
             query_embedding=query_embedding,
             filters=filters,
@@ -750,11 +1016,49 @@ class OpenSearchDocumentStore:
             custom_query=custom_query,
             efficient_filtering=efficient_filtering,
         )
-        return self._search_documents(search_params)
+        documents = self._search_documents(search_params)
+
+        self._cache_documents(cache_key, documents)
+        return documents
+
+    def _embedding_retrieval_batch(
+        self,
+        query_embeddings: Union[List[QueryEmbedding], np.ndarray],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        custom_query: Optional[Dict[str, Any]] = None,
+        efficient_filtering: bool = False,
+    ) -> List[List[Document]]:
+        """
+        Retrieves the documents most similar to each of the provided query embeddings.
+
+        All queries are sent to OpenSearch in a single multi search request.
+        The results are returned in the same order as `query_embeddings`.
+
+        This method is not meant to be part of the public interface of
+        `OpenSearchDocumentStore` nor called directly.
+        `OpenSearchEmbeddingRetriever` uses this method directly and is the public interface for it.
+
+        See `OpenSearchEmbeddingRetriever` for more information.
+        """
+        self._ensure_initialized()
+
+        request_bodies = [
+            self._prepare_embedding_search_request(
+                query_embedding=query_embedding,
+                filters=filters,
+                top_k=top_k,
+                custom_query=custom_query,
+                efficient_filtering=efficient_filtering,
+            )
+            for query_embedding in query_embeddings
+        ]
+        return self._msearch_documents(request_bodies)
 
     async def _embedding_retrieval_async(
         self,
-        query_embedding: List[float],
+        query_embedding: QueryEmbedding,
         *,
         filters: Optional[Dict[str, Any]] = None,
         top_k: int = 10,
@@ -773,6 +1077,17 @@ class OpenSearchDocumentStore:
         """
         self._ensure_initialized()
 
+        cache_key = self._get_query_cache_key(
+            retrieval="embedding",
+            query_embedding=query_embedding,
+            filters=filters,
+            top_k=top_k,
+            custom_query=custom_query,
+            efficient_filtering=efficient_filtering,
+        )
+        if (cached_documents := self._get_cached_documents(cache_key)) is not None:
+            return cached_documents
+
         search_params = self._prepare_embedding_search_request(
             query_embedding=query_embedding,
             filters=filters,
@@ -780,21 +1095,42 @@ class OpenSearchDocumentStore:
             custom_query=custom_query,
             efficient_filtering=efficient_filtering,
         )
-        return await self._search_documents_async(search_params)
+        documents = await self._search_documents_async(search_params)
 
-    def _render_custom_query(self, custom_query: Any, substitutions: Dict[str, Any]) -> Any:
+        self._cache_documents(cache_key, documents)
+        return documents
+
+    def _render_custom_query(
+        self,
+        custom_query: Dict[str, Any],
+        substitutions: Dict[str, Any],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """
-        Recursively replaces the placeholders in the custom_query with the actual values.
+        Replaces the placeholders in the custom_query with the actual values.
+
+        The custom query is left untouched, the placeholders are replaced in a copy of it.
 
         :param custom_query: The custom query to replace the placeholders in.
         :param substitutions: The dictionary containing the actual values to replace the placeholders with.
+        :param filters: The filters for the `$filters` placeholder. They are only normalized if the custom query
+            contains the placeholder. Empty filters are replaced with a query matching all documents.
         :returns: The custom query with the placeholders replaced.
         """
-        if isinstance(custom_query, dict):
-            return {key: self._render_custom_query(value, substitutions) for key, value in custom_query.items()}
-        elif isinstance(custom_query, list):
-            return [self._render_custom_query(entry, substitutions) for entry in custom_query]
-        elif isinstance(custom_query, str):
-            return substitutions.get(custom_query, custom_query)
+        template, placeholder_paths, _ = _compile_custom_query(custom_query)
+        if "$filters" in placeholder_paths:
+            # Without filters, match every document so the filter clause has no effect on the results.
+            # Each rendered query gets its own dict, so modifying one request body never affects another.
+            substitutions = {**substitutions, "$filters": normalize_filters(filters) if filters else {"match_all": {}}}
+        # Copy-on-write: only the containers on the way to a placeholder are copied,
+        # all other parts of the rendered query are shared with the template
+        rendered = copy.copy(template)
+        copied: Dict[CustomQueryPath, Any] = {}
+        for placeholder, paths in placeholder_paths.items():
+            if placeholder not in substitutions:
+                continue
+            for path in paths:
+                parent = _copy_path(rendered, path, copied)
+                parent[path[-1]] = substitutions[placeholder]  # type: ignore[index]
 
-        return custom_query
+        return rendered
@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from haystack.dataclasses import Document
+
+# orjson is optional, it only speeds up building cache keys
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+DEFAULT_CACHE_CONFIG: Dict[str, Any] = {"enabled": False, "max_size": 2000, "ttl_seconds": 300}
+
+# Query constructs whose results change between two identical requests
+NON_DETERMINISTIC_QUERY_KEYS = ("random_score", "script_score")
+
+
+def _key_default(obj: Any) -> Any:
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    msg = f"Object of type {type(obj).__name__} can't be part of a cache key"
+    raise TypeError(msg)
+
+
+def is_deterministic_query(custom_query: Any) -> bool:
+    """
+    Checks whether a custom query always returns the same results for the same documents.
+
+    Queries using random scoring, scripts, or date math relative to `now` are not deterministic.
+    """
+    if isinstance(custom_query, dict):
+        return all(
+            key not in NON_DETERMINISTIC_QUERY_KEYS and is_deterministic_query(value)
+            for key, value in custom_query.items()
+        )
+    if isinstance(custom_query, list):
+        return all(is_deterministic_query(entry) for entry in custom_query)
+    if isinstance(custom_query, str):
+        return not custom_query.startswith("now")
+    return True
+
+
+class QueryCache:
+    """
+    A thread-safe LRU cache with a time-to-live for the results of search requests.
+
+    Documents are copied when they are stored and when they are returned,
+    so callers can't modify the cached results.
+    """
+
+    def __init__(self, *, max_size: int, ttl_seconds: float):
+        """
+        Creates a new QueryCache instance.
+
+        :param max_size: Maximum number of search results to keep. The least recently used ones are evicted first.
+        :param ttl_seconds: Number of seconds after which a cached search result expires.
+        """
+        if max_size <= 0:
+            msg = "max_size of the query cache must be a positive integer"
+            raise ValueError(msg)
+
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, Tuple[float, List[Document]]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Builds a cache key from JSON-compatible parts, NumPy arrays are supported as well.
+        """
+        serialized: bytes
+        if orjson is not None:
+            serialized = orjson.dumps(parts, default=_key_default, option=orjson.OPT_SORT_KEYS)
+        else:
+            serialized = json.dumps(parts, default=_key_default, sort_keys=True).encode()
+        return blake2b(serialized, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Document]]:
+        """
+        Returns the cached documents for `key`, or None if there are none or they expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self._ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return copy.deepcopy(entry[1])
+
+    def put(self, key: str, documents: List[Document]) -> None:
+        """
+        Stores `documents` under `key`, evicting the least recently used entries if the cache is full.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(documents))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the number of hits, misses, and evictions, and the current and maximum size of the cache.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "max_size": self._max_size,
+            }
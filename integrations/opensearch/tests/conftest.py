@@ -1,11 +1,52 @@
 import asyncio
+from typing import List
 
 import pytest
 from haystack import Document
+from haystack.document_stores.types import DuplicatePolicy
+from opensearchpy import OpenSearch
+from opensearchpy.helpers import bulk
 
 from haystack_integrations.document_stores.opensearch.document_store import OpenSearchDocumentStore
 
 
+@pytest.fixture(scope="session")
+def opensearch_client():
+    """
+    A single OpenSearch client shared by the whole test session.
+    Fixtures that only need synchronous access hand it to their document stores,
+    so every test doesn't open its own connection pool.
+    """
+    client = OpenSearch(hosts=["https://localhost:9200"], http_auth=("admin", "admin"), verify_certs=False)
+    yield client
+    client.close()
+
+
+def _use_shared_client(store: OpenSearchDocumentStore, client: OpenSearch) -> OpenSearchDocumentStore:
+    """
+    Creates the index of `store` with `client` and makes the store use `client` instead of building its own.
+    Stores prepared this way don't have an async client.
+    """
+    client.indices.create(index=store._index, body={"mappings": store._mappings, "settings": store._settings})
+    store._client = client
+    store._initialized = True
+    return store
+
+
+def _bulk_write(store: OpenSearchDocumentStore, documents: List[Document]) -> None:
+    """
+    Writes `documents` with a single bulk request and refreshes the index once, so they are searchable right away.
+    Use this instead of `write_documents` for stores whose index has periodic refreshes disabled.
+    """
+    bulk_params = store._prepare_bulk_write_request(
+        documents=documents, policy=DuplicatePolicy.OVERWRITE, is_async=False
+    )
+    # "wait_for" would block forever on an index with `refresh_interval: -1`, so force the refresh instead
+    bulk_params["refresh"] = True
+    _, errors = bulk(**bulk_params, chunk_size=500)
+    assert not errors
+
+
 @pytest.fixture
 def document_store(request):
     """
@@ -61,6 +102,30 @@ def document_store_readonly(request):
     asyncio.run(store._async_client.close())
 
 
+@pytest.fixture
+def document_store_embedding_dim_4(request, opensearch_client):
+    """
+    A document store with embedding dimension 4 that uses the session-wide OpenSearch client.
+    Only the index is created and deleted for each test. Not suitable for async tests.
+
+    Periodic refreshes are disabled on the index, so documents must be written with `_bulk_write`.
+    """
+    # Use a different index for each test so we can run them in parallel
+    index = f"{request.node.name}"
+
+    store = OpenSearchDocumentStore(
+        hosts=["https://localhost:9200"],
+        index=index,
+        embedding_dim=4,
+        return_embedding=True,
+        method={"space_type": "cosinesimil", "engine": "nmslib", "name": "hnsw"},
+        settings={"index.knn": True, "refresh_interval": "-1", "number_of_replicas": 0},
+    )
+    yield _use_shared_client(store, opensearch_client)
+
+    opensearch_client.indices.delete(index=index, params={"ignore": [400, 404]})
+
+
 @pytest.fixture
 def document_store_embedding_dim_4_no_emb_returned(request):
     """
@@ -253,6 +253,7 @@ class TestDocumentStoreWithAuth:
                 "use_ssl": None,
                 "verify_certs": None,
                 "timeout": None,
+                "cache_config": None,
             },
         }
 
@@ -299,6 +300,7 @@ class TestDocumentStoreWithAuth:
                 "use_ssl": None,
                 "verify_certs": None,
                 "timeout": None,
+                "cache_config": None,
             },
         }
 
@@ -59,6 +59,7 @@ def test_to_dict(_mock_opensearch_client):
                     "use_ssl": None,
                     "verify_certs": None,
                     "timeout": None,
+                    "cache_config": None,
                 },
                 "type": "haystack_integrations.document_stores.opensearch.document_store.OpenSearchDocumentStore",
             },
@@ -319,3 +320,31 @@ def test_run_ignore_errors(caplog):
     assert len(res) == 1
     assert res["documents"] == []
     assert "Some error" in caplog.text
+
+
+def test_run_batch():
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store._bm25_retrieval_batch.return_value = [[Document(content="Test doc")], []]
+    retriever = OpenSearchBM25Retriever(document_store=mock_store, top_k=11)
+    res = retriever.run_batch(queries=["some query", "another query"], filters={"from": "run"})
+    mock_store._bm25_retrieval_batch.assert_called_once_with(
+        queries=["some query", "another query"],
+        filters={"from": "run"},
+        fuzziness="AUTO",
+        top_k=11,
+        scale_score=False,
+        all_terms_must_match=False,
+        custom_query=None,
+    )
+    assert len(res["documents"]) == 2
+    assert res["documents"][0][0].content == "Test doc"
+    assert res["documents"][1] == []
+
+
+def test_run_batch_ignore_errors(caplog):
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store._bm25_retrieval_batch.side_effect = Exception("Some error")
+    retriever = OpenSearchBM25Retriever(document_store=mock_store, raise_on_failure=False)
+    res = retriever.run_batch(queries=["some query", "another query"])
+    assert res["documents"] == [[], []]
+    assert "Some error" in caplog.text
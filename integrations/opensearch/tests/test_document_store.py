@@ -1,19 +1,33 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
-import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 from haystack.dataclasses.document import Document
 from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumentError
 from haystack.document_stores.types import DuplicatePolicy
 from haystack.testing.document_store import CountDocumentsTest, DeleteDocumentsTest, WriteDocumentsTest
 from opensearchpy.exceptions import RequestError
+from opensearchpy.serializer import JSONSerializer
 
+from haystack_integrations.components.retrievers.opensearch import (
+    OpenSearchBM25Retriever,
+    OpenSearchEmbeddingRetriever,
+)
 from haystack_integrations.document_stores.opensearch import OpenSearchDocumentStore
-from haystack_integrations.document_stores.opensearch.document_store import DEFAULT_MAX_CHUNK_BYTES
+from haystack_integrations.document_stores.opensearch.document_store import (
+    CUSTOM_QUERY_CACHE_SIZE,
+    DEFAULT_MAX_CHUNK_BYTES,
+    _compile_custom_query,
+    _compiled_custom_queries,
+)
+
+from .conftest import _bulk_write, _use_shared_client
 
 
 @patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
@@ -42,6 +56,7 @@ def test_to_dict(_mock_opensearch_client):
             "use_ssl": None,
             "verify_certs": None,
             "timeout": None,
+            "cache_config": None,
         },
     }
 
@@ -110,6 +125,377 @@ def test_get_default_mappings(_mock_opensearch_client):
     }
 
 
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_embedding_retrieval_batch_uses_single_msearch(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost", index="test_index")
+    mock_client = _mock_opensearch_client.return_value
+    mock_client.msearch.return_value = {
+        "responses": [
+            {"hits": {"hits": [{"_source": {"id": "1", "content": "first"}, "_score": 1.0}]}},
+            {"hits": {"hits": []}},
+        ]
+    }
+
+    results = store._embedding_retrieval_batch(query_embeddings=[[0.1, 0.2], [0.3, 0.4]], top_k=5)
+
+    mock_client.msearch.assert_called_once()
+    mock_client.search.assert_not_called()
+    body = mock_client.msearch.call_args.kwargs["body"]
+    assert body[0] == {"index": "test_index"}
+    assert body[1]["query"]["bool"]["must"][0]["knn"]["embedding"]["vector"] == [0.1, 0.2]
+    assert body[2] == {"index": "test_index"}
+    assert body[3]["query"]["bool"]["must"][0]["knn"]["embedding"]["vector"] == [0.3, 0.4]
+    assert [[doc.id for doc in docs] for docs in results] == [["1"], []]
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_bm25_retrieval_batch_raises_on_failed_query(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost", index="test_index")
+    mock_client = _mock_opensearch_client.return_value
+    mock_client.msearch.return_value = {
+        "responses": [{"hits": {"hits": []}}, {"error": {"type": "search_phase_execution_exception"}, "status": 400}]
+    }
+
+    with pytest.raises(DocumentStoreError, match="search_phase_execution_exception"):
+        store._bm25_retrieval_batch(queries=["first", "second"])
+
+
+@pytest.mark.parametrize("filters", [None, {}])
+def test_prepare_search_requests_with_custom_query_and_empty_filters(filters):
+    store = OpenSearchDocumentStore(hosts="testhost")
+
+    with patch(
+        "haystack_integrations.document_stores.opensearch.document_store.normalize_filters"
+    ) as mock_normalize_filters:
+        bm25_body = store._prepare_bm25_search_request(
+            query="functional",
+            filters=filters,
+            fuzziness="AUTO",
+            top_k=3,
+            all_terms_must_match=False,
+            custom_query={"query": {"bool": {"must": {"match": {"content": "$query"}}, "filter": "$filters"}}},
+        )
+        embedding_body = store._prepare_embedding_search_request(
+            query_embedding=[0.1, 0.2],
+            filters=filters,
+            top_k=3,
+            custom_query={
+                "query": {
+                    "bool": {
+                        "must": [{"knn": {"embedding": {"vector": "$query_embedding", "k": 3}}}],
+                        "filter": "$filters",
+                    }
+                }
+            },
+        )
+
+    mock_normalize_filters.assert_not_called()
+    assert bm25_body["query"]["bool"] == {"must": {"match": {"content": "functional"}}, "filter": {"match_all": {}}}
+    assert embedding_body["query"]["bool"]["filter"] == {"match_all": {}}
+    assert embedding_body["query"]["bool"]["must"][0]["knn"]["embedding"]["vector"] == [0.1, 0.2]
+
+
+def test_prepare_bm25_search_request_with_custom_query_without_filters_placeholder():
+    store = OpenSearchDocumentStore(hosts="testhost")
+
+    with patch(
+        "haystack_integrations.document_stores.opensearch.document_store.normalize_filters"
+    ) as mock_normalize_filters:
+        body = store._prepare_bm25_search_request(
+            query="functional",
+            filters={"field": "meta.language_type", "operator": "==", "value": "functional"},
+            fuzziness="AUTO",
+            top_k=3,
+            all_terms_must_match=False,
+            custom_query={"query": {"match": {"content": "$query"}}},
+        )
+
+    # The filters can't end up in the request, so they are not normalized at all
+    mock_normalize_filters.assert_not_called()
+    assert body["query"] == {"match": {"content": "functional"}}
+
+
+def test_prepare_embedding_search_request_with_numpy_embedding():
+    store = OpenSearchDocumentStore(hosts="testhost")
+    query_embedding = np.array([0.5, 0.25], dtype=np.float32)
+
+    body = store._prepare_embedding_search_request(
+        query_embedding=query_embedding, filters=None, top_k=3, custom_query=None
+    )
+
+    # The array is passed through as is and only converted when the client serializes the request
+    assert body["query"]["bool"]["must"][0]["knn"]["embedding"]["vector"] is query_embedding
+    assert '"vector":[0.5,0.25]' in JSONSerializer().dumps(body)
+
+    with pytest.raises(ValueError, match="non-empty"):
+        store._prepare_embedding_search_request(query_embedding=np.array([]), filters=None, top_k=3, custom_query=None)
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_query_cache_disabled_by_default(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost")
+    mock_client = _mock_opensearch_client.return_value
+    mock_client.search.return_value = {"hits": {"hits": []}}
+
+    store._bm25_retrieval("functional")
+    store._bm25_retrieval("functional")
+
+    assert mock_client.search.call_count == 2
+    assert store.get_cache_stats()["enabled"] is False
+
+
+def test_query_cache_unknown_config_keys():
+    with pytest.raises(ValueError, match="Unknown cache_config keys: size"):
+        OpenSearchDocumentStore(hosts="testhost", cache_config={"enabled": True, "size": 10})
+
+
+@pytest.mark.parametrize(
+    "cache_config, message",
+    [
+        ({"enabled": True, "max_size": "10"}, "max_size must be a positive integer, got '10'"),
+        ({"enabled": True, "max_size": 0}, "max_size must be a positive integer, got 0"),
+        ({"enabled": True, "ttl_seconds": -1}, "ttl_seconds must be a non-negative number, got -1"),
+        ({"enabled": True, "ttl_seconds": "300"}, "ttl_seconds must be a non-negative number, got '300'"),
+    ],
+)
+def test_query_cache_invalid_config_values(cache_config, message):
+    with pytest.raises(ValueError, match=message):
+        OpenSearchDocumentStore(hosts="testhost", cache_config=cache_config)
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.bulk")
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_query_cache(_mock_opensearch_client, mock_bulk):
+    store = OpenSearchDocumentStore(hosts="testhost", cache_config={"enabled": True})
+    mock_client = _mock_opensearch_client.return_value
+    mock_client.search.return_value = {"hits": {"hits": [{"_source": {"id": "1", "content": "cached"}, "_score": 1.0}]}}
+    mock_bulk.return_value = (1, [])
+
+    first = store._embedding_retrieval(query_embedding=[0.1, 0.2], filters={})
+    second = store._embedding_retrieval(query_embedding=[0.1, 0.2], filters={})
+    assert mock_client.search.call_count == 1
+    assert first == second
+
+    # Different parameters are cached separately
+    store._embedding_retrieval(query_embedding=[0.1, 0.2], filters={}, top_k=5)
+    assert mock_client.search.call_count == 2
+
+    # Writing documents invalidates the cached results
+    store.write_documents([Document(content="new")])
+    store._embedding_retrieval(query_embedding=[0.1, 0.2], filters={})
+    assert mock_client.search.call_count == 3
+
+    # Results of non deterministic queries are not cached
+    custom_query = {"query": {"function_score": {"query": {"match": {"content": "$query"}}, "random_score": {}}}}
+    store._bm25_retrieval("functional", custom_query=custom_query)
+    store._bm25_retrieval("functional", custom_query=custom_query)
+    assert mock_client.search.call_count == 5
+
+    assert store.get_cache_stats() == {
+        "enabled": True,
+        "hits": 1,
+        "misses": 3,
+        "evictions": 0,
+        "size": 3,
+        "max_size": 2000,
+    }
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_query_cache_checks_custom_query_once(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost", cache_config={"enabled": True})
+    _mock_opensearch_client.return_value.search.return_value = {"hits": {"hits": []}}
+    custom_query = {"query": {"match": {"content": "$query"}}}
+
+    with patch(
+        "haystack_integrations.document_stores.opensearch.document_store.is_deterministic_query", return_value=True
+    ) as mock_is_deterministic:
+        for query in ("first", "second", "third"):
+            store._bm25_retrieval(query, custom_query=custom_query)
+    mock_is_deterministic.assert_called_once()
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_query_cache_numpy_scalars(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost", cache_config={"enabled": True})
+    mock_client = _mock_opensearch_client.return_value
+    mock_client.search.return_value = {"hits": {"hits": []}}
+
+    query_embedding = list(np.array([0.1, 0.2], dtype=np.float32))
+    assert store._embedding_retrieval(query_embedding=query_embedding) == []
+    assert store._embedding_retrieval(query_embedding=query_embedding) == []
+    assert mock_client.search.call_count == 1
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_query_cache_skipped_without_cache_key(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost", cache_config={"enabled": True})
+    mock_client = _mock_opensearch_client.return_value
+    mock_client.search.return_value = {"hits": {"hits": []}}
+
+    # The cache key can't be built for objects the OpenSearch client may still be able to serialize
+    filters = {"field": "meta.date", "operator": "==", "value": object()}
+    assert store._get_query_cache_key(filters=filters) is None
+    with patch("haystack_integrations.document_stores.opensearch.document_store.normalize_filters") as mock_normalize:
+        mock_normalize.return_value = {"match_all": {}}
+        store._bm25_retrieval("functional", filters=filters)
+        store._bm25_retrieval("functional", filters=filters)
+    assert mock_client.search.call_count == 2
+    assert store.get_cache_stats()["size"] == 0
+
+
+def test_compile_custom_query():
+    custom_query = {
+        "query": {
+            "bool": {
+                "must": [{"knn": {"embedding": {"vector": "$query_embedding", "k": 3}}}],
+                "filter": "$filters",
+            }
+        }
+    }
+
+    template, placeholder_paths, deterministic = _compile_custom_query(custom_query)
+
+    assert template == custom_query
+    assert deterministic is True
+    assert placeholder_paths == {
+        "$query_embedding": [("query", "bool", "must", 0, "knn", "embedding", "vector")],
+        "$filters": [("query", "bool", "filter")],
+    }
+    # Compiled queries are cached, but changes to the custom query are picked up
+    assert _compile_custom_query(custom_query)[0] is template
+    custom_query["query"]["bool"]["must"][0]["knn"]["embedding"]["k"] = "$top_k"
+    assert _compile_custom_query(custom_query)[1]["$top_k"] == [("query", "bool", "must", 0, "knn", "embedding", "k")]
+
+
+def test_compile_custom_query_with_numpy_values():
+    custom_query = {
+        "query": {
+            "script_score": {
+                "query": {"match": {"content": "$query"}},
+                "script": {"source": "dotProduct(params.v, 'embedding')", "params": {"v": np.ones(4)}},
+            }
+        }
+    }
+
+    compiled = _compile_custom_query(custom_query)
+    assert _compile_custom_query(custom_query) is compiled
+    custom_query["query"]["script_score"]["script"]["params"]["v"] = np.zeros(4)
+    recompiled = _compile_custom_query(custom_query)
+    assert recompiled is not compiled
+    assert recompiled.template["query"]["script_score"]["script"]["params"]["v"].tolist() == [0.0] * 4
+
+
+@pytest.mark.parametrize("new_value", [True, 1.0])
+def test_compile_custom_query_detects_edits_to_equal_values(new_value):
+    custom_query = {"query": {"match": {"content": "$query"}}, "size": 1}
+    _compile_custom_query(custom_query)
+
+    custom_query["size"] = new_value
+    assert type(_compile_custom_query(custom_query).template["size"]) is type(new_value)
+
+
+def test_compile_custom_query_without_fingerprint():
+    custom_query = {"query": {"match": {"content": "$query"}}, "ext": {"value": object()}}
+
+    assert _compile_custom_query(custom_query).placeholder_paths == {"$query": [("query", "match", "content")]}
+    assert id(custom_query) not in _compiled_custom_queries
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_bm25_retrieval_reuses_custom_query_with_numpy_values(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost", cache_config={"enabled": True})
+    _mock_opensearch_client.return_value.search.return_value = {"hits": {"hits": []}}
+    custom_query = {"query": {"match": {"content": "$query"}}, "ext": {"v": np.ones(4)}}
+
+    assert store._bm25_retrieval("functional", custom_query=custom_query) == []
+    assert store._bm25_retrieval("functional", custom_query=custom_query) == []
+
+
+def test_compile_custom_query_evicts_oldest_entries():
+    custom_queries = [
+        {"query": {"match": {"content": "$query"}}, "size": i} for i in range(CUSTOM_QUERY_CACHE_SIZE + 10)
+    ]
+    for custom_query in custom_queries:
+        _compile_custom_query(custom_query)
+
+    assert len(_compiled_custom_queries) == CUSTOM_QUERY_CACHE_SIZE
+    assert id(custom_queries[9]) not in _compiled_custom_queries
+    assert all(id(custom_query) in _compiled_custom_queries for custom_query in custom_queries[10:])
+
+
+def test_compile_custom_query_concurrently():
+    custom_queries = [
+        {"query": {"match": {"content": "$query"}}, "size": i} for i in range(CUSTOM_QUERY_CACHE_SIZE * 4)
+    ]
+    # Switch threads as often as possible to provoke races between evictions
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(_compile_custom_query, custom_queries))
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert [compiled.template for compiled in results] == custom_queries
+    assert len(_compiled_custom_queries) == CUSTOM_QUERY_CACHE_SIZE
+
+
+def test_render_custom_query_does_not_modify_custom_query():
+    store = OpenSearchDocumentStore(hosts="testhost")
+    custom_query = {"query": {"bool": {"should": ["$query", {"match": {"title": "$query"}}], "filter": "$filters"}}}
+
+    first = store._render_custom_query(
+        custom_query, {"$query": "first"}, filters={"field": "meta.a", "operator": "==", "value": 1}
+    )
+    second = store._render_custom_query(custom_query, {"$query": "second"})
+    third = store._render_custom_query(custom_query, {})
+
+    assert first == {
+        "query": {
+            "bool": {
+                "should": ["first", {"match": {"title": "first"}}],
+                "filter": {"bool": {"must": {"term": {"a": 1}}}},
+            }
+        }
+    }
+    assert second == {
+        "query": {"bool": {"should": ["second", {"match": {"title": "second"}}], "filter": {"match_all": {}}}}
+    }
+    # Placeholders without a substitution are kept
+    assert third["query"]["bool"]["should"] == ["$query", {"match": {"title": "$query"}}]
+    assert third["query"]["bool"]["filter"] == {"match_all": {}}
+    assert third["query"]["bool"]["filter"] is not second["query"]["bool"]["filter"]
+    assert custom_query == {
+        "query": {"bool": {"should": ["$query", {"match": {"title": "$query"}}], "filter": "$filters"}}
+    }
+
+
+def test_render_custom_query_copies_only_placeholder_paths():
+    store = OpenSearchDocumentStore(hosts="testhost")
+    custom_query = {
+        "query": {
+            "bool": {
+                "must": [{"knn": {"embedding": {"vector": "$query_embedding", "k": 3}}}, {"exists": {"field": "a"}}],
+                "filter": "$filters",
+            }
+        },
+        "aggs": {"types": {"terms": {"field": "type"}}},
+    }
+    template = _compile_custom_query(custom_query).template
+
+    rendered = store._render_custom_query(custom_query, {"$query_embedding": [0.1, 0.2]})
+    rendered["size"] = 10
+
+    assert rendered["query"]["bool"]["must"][0]["knn"]["embedding"] == {"vector": [0.1, 0.2], "k": 3}
+    assert rendered["query"]["bool"]["filter"] == {"match_all": {}}
+    # Parts without placeholders are shared with the template, everything else is copied
+    assert rendered["aggs"] is template["aggs"]
+    assert rendered["query"]["bool"]["must"][1] is template["query"]["bool"]["must"][1]
+    assert rendered["query"]["bool"]["must"][0] is not template["query"]["bool"]["must"][0]
+    assert template == custom_query
+
+
 @pytest.mark.integration
 class TestDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDocumentsTest):
     """
@@ -270,6 +656,29 @@ class TestDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDocumentsT
         assert results[0].content == "Most similar document"
         assert results[1].content == "2nd best document"
 
+    def test_embedding_retrieval_batch(self, document_store_embedding_dim_4: OpenSearchDocumentStore):
+        docs = [
+            Document(content="Most similar document", embedding=[1.0, 1.0, 1.0, 1.0]),
+            Document(content="Opposite document", embedding=[-1.0, -1.0, -1.0, -1.0]),
+        ]
+        _bulk_write(document_store_embedding_dim_4, docs)
+        # All query embeddings are passed as a single contiguous array
+        query_embeddings = np.array([[0.1, 0.1, 0.1, 0.1], [-0.1, -0.1, -0.1, -0.1]], dtype=np.float32)
+        results = document_store_embedding_dim_4._embedding_retrieval_batch(
+            query_embeddings=query_embeddings, top_k=1, filters={}
+        )
+        assert len(results) == 2
+        assert results[0][0].content == "Most similar document"
+        assert results[1][0].content == "Opposite document"
+        assert results[0][0].embedding == [1.0, 1.0, 1.0, 1.0]
+
+    def test_bm25_retrieval_batch(self, document_store: OpenSearchDocumentStore, test_documents: List[Document]):
+        document_store.write_documents(test_documents)
+        results = document_store._bm25_retrieval_batch(["Haskell", "Python"], top_k=1)
+        assert len(results) == 2
+        assert results[0][0].id == "1"
+        assert results[1][0].id == "9"
+
     def test_embedding_retrieval_with_filters(
         self, document_store_embedding_dim_4_no_emb_returned: OpenSearchDocumentStore
     ):
@@ -323,9 +732,9 @@ class TestDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDocumentsT
         Test that handling of pagination works as expected, when the matching documents are > 10.
         """
 
+        embeddings = np.random.default_rng(seed=42).random((20, 4))
         docs = [
-            Document(content=f"Document {i}", embedding=[random.random() for _ in range(4)])  # noqa: S311
-            for i in range(20)
+            Document(content=f"Document {i}", embedding=embedding.tolist()) for i, embedding in enumerate(embeddings)
         ]
 
         document_store_embedding_dim_4_no_emb_returned.write_documents(docs)
@@ -404,26 +813,23 @@ class TestDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDocumentsT
         assert mock_bulk.call_args.kwargs["max_chunk_bytes"] == DEFAULT_MAX_CHUNK_BYTES
 
     @pytest.fixture
-    def document_store_embedding_dim_4_no_emb_returned(self, request):
+    def document_store_embedding_dim_4_no_emb_returned(self, request, opensearch_client):
         """
         This is the most basic requirement for the child class: provide
         an instance of this document store so the base class can use it.
         """
-        hosts = ["https://localhost:9200"]
         # Use a different index for each test so we can run them in parallel
         index = f"{request.node.name}"
 
         store = OpenSearchDocumentStore(
-            hosts=hosts,
+            hosts=["https://localhost:9200"],
             index=index,
-            http_auth=("admin", "admin"),
-            verify_certs=False,
             embedding_dim=4,
             return_embedding=False,
             method={"space_type": "cosinesimil", "engine": "nmslib", "name": "hnsw"},
         )
-        yield store
-        store._client.indices.delete(index=index, params={"ignore": [400, 404]})
+        yield _use_shared_client(store, opensearch_client)
+        opensearch_client.indices.delete(index=index, params={"ignore": [400, 404]})
 
     def test_embedding_retrieval_but_dont_return_embeddings_for_embedding_retrieval(
         self, document_store_embedding_dim_4_no_emb_returned: OpenSearchDocumentStore
@@ -468,3 +874,67 @@ class TestDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDocumentsT
         assert results[0].embedding is None
         assert results[1].embedding is None
         assert results[2].embedding is None
+
+
+@pytest.mark.integration
+class TestCustomQueryEmptyFilters:
+    """
+    Custom queries with a `$filters` placeholder must keep working when no filters are given.
+    The tests only read from the index, so it is created and populated once for the whole class.
+    """
+
+    @pytest.fixture(scope="class")
+    def document_store_embedding_dim_4_shared(self, request, opensearch_client):
+        """
+        A document store shared by all tests of the class.
+
+        Refreshes are disabled on its index, so documents must be written with `_bulk_write`,
+        `write_documents` would wait for a refresh that never happens.
+        """
+        # Index names must be lowercase
+        index = f"{request.node.name}".lower()
+
+        store = OpenSearchDocumentStore(
+            hosts=["https://localhost:9200"],
+            index=index,
+            embedding_dim=4,
+            method={"space_type": "cosinesimil", "engine": "nmslib", "name": "hnsw"},
+            settings={"index.knn": True, "refresh_interval": "-1", "number_of_replicas": 0},
+        )
+        _use_shared_client(store, opensearch_client)
+        _bulk_write(
+            store,
+            [
+                Document(content="Haskell is a functional programming language", embedding=[1.0, 1.0, 1.0, 1.0]),
+                Document(content="Java is an object oriented programming language", embedding=[-1.0, 1.0, -1.0, 1.0]),
+            ],
+        )
+        yield store
+        opensearch_client.indices.delete(index=index, params={"ignore": [400, 404]})
+
+    @pytest.mark.parametrize("filters", [{}, None])
+    @pytest.mark.parametrize("retriever_kind", ["embedding", "bm25"])
+    def test_custom_query_with_empty_or_none_filters(
+        self, document_store_embedding_dim_4_shared, retriever_kind, filters
+    ):
+        if retriever_kind == "embedding":
+            retriever = OpenSearchEmbeddingRetriever(
+                document_store=document_store_embedding_dim_4_shared,
+                custom_query={
+                    "query": {
+                        "bool": {
+                            "must": [{"knn": {"embedding": {"vector": "$query_embedding", "k": 2}}}],
+                            "filter": "$filters",
+                        }
+                    }
+                },
+            )
+            result = retriever.run(query_embedding=[0.1, 0.1, 0.1, 0.1], filters=filters, top_k=1)
+        else:
+            retriever = OpenSearchBM25Retriever(
+                document_store=document_store_embedding_dim_4_shared,
+                custom_query={"query": {"bool": {"must": {"match": {"content": "$query"}}, "filter": "$filters"}}},
+            )
+            result = retriever.run(query="functional", filters=filters, top_k=1)
+
+        assert [doc.content for doc in result["documents"]] == ["Haskell is a functional programming language"]
@@ -75,6 +75,7 @@ def test_to_dict(_mock_opensearch_client):
                     "use_ssl": None,
                     "verify_certs": None,
                     "timeout": None,
+                    "cache_config": None,
                 },
                 "type": "haystack_integrations.document_stores.opensearch.document_store.OpenSearchDocumentStore",
             },
@@ -263,3 +264,29 @@ def test_run_ignore_errors(caplog):
     assert len(res) == 1
     assert res["documents"] == []
     assert "Some error" in caplog.text
+
+
+def test_run_batch():
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store._embedding_retrieval_batch.return_value = [[Document(content="Test doc", embedding=[0.1, 0.2])], []]
+    retriever = OpenSearchEmbeddingRetriever(document_store=mock_store)
+    res = retriever.run_batch(query_embeddings=[[0.5, 0.7], [0.3, 0.1]], top_k=3)
+    mock_store._embedding_retrieval_batch.assert_called_once_with(
+        query_embeddings=[[0.5, 0.7], [0.3, 0.1]],
+        filters={},
+        top_k=3,
+        custom_query=None,
+        efficient_filtering=False,
+    )
+    assert len(res["documents"]) == 2
+    assert res["documents"][0][0].content == "Test doc"
+    assert res["documents"][1] == []
+
+
+def test_run_batch_ignore_errors(caplog):
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store._embedding_retrieval_batch.side_effect = Exception("Some error")
+    retriever = OpenSearchEmbeddingRetriever(document_store=mock_store, raise_on_failure=False)
+    res = retriever.run_batch(query_embeddings=[[0.5, 0.7], [0.3, 0.1]])
+    assert res["documents"] == [[], []]
+    assert "Some error" in caplog.text
@@ -46,6 +46,7 @@ class TestOpenSearchHybridRetriever:
                     "use_ssl": None,
                     "verify_certs": None,
                     "timeout": None,
+                    "cache_config": None,
                 },
             },
             "embedder": {
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from haystack.dataclasses import Document
+
+from haystack_integrations.document_stores.opensearch.query_cache import QueryCache, is_deterministic_query
+
+
+def test_init_invalid_max_size():
+    with pytest.raises(ValueError, match="positive integer"):
+        QueryCache(max_size=0, ttl_seconds=10)
+
+
+def test_get_returns_copies():
+    cache = QueryCache(max_size=10, ttl_seconds=10)
+    documents = [Document(id="1", content="cached", meta={"state": "cached"})]
+    cache.put("key", documents)
+    documents[0].meta["state"] = "modified after put"
+
+    cached = cache.get("key")
+    assert cached[0].meta == {"state": "cached"}
+    cached[0].meta["state"] = "modified after get"
+    assert cache.get("key")[0].meta == {"state": "cached"}
+    assert cache.get("other key") is None
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 0, "size": 1, "max_size": 10}
+
+
+def test_lru_eviction():
+    cache = QueryCache(max_size=2, ttl_seconds=10)
+    cache.put("a", [Document(id="a")])
+    cache.put("b", [Document(id="b")])
+    cache.get("a")
+    cache.put("c", [Document(id="c")])
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry():
+    cache = QueryCache(max_size=10, ttl_seconds=5)
+    with patch("haystack_integrations.document_stores.opensearch.query_cache.time.monotonic") as mock_monotonic:
+        mock_monotonic.return_value = 100.0
+        cache.put("key", [Document(id="1")])
+        mock_monotonic.return_value = 104.0
+        assert cache.get("key") is not None
+        mock_monotonic.return_value = 106.0
+        assert cache.get("key") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_make_key():
+    filters = {"field": "meta.a", "operator": "==", "value": 1}
+    reordered_filters = {"value": 1, "operator": "==", "field": "meta.a"}
+
+    assert QueryCache.make_key("index", 0, {"filters": filters}) == QueryCache.make_key(
+        "index", 0, {"filters": reordered_filters}
+    )
+    assert QueryCache.make_key("index", 0, {"query": "a"}) != QueryCache.make_key("index", 1, {"query": "a"})
+    assert QueryCache.make_key("index", 0, {"query_embedding": np.array([0.5, 0.25])}) == QueryCache.make_key(
+        "index", 0, {"query_embedding": [0.5, 0.25]}
+    )
+    assert QueryCache.make_key("index", 0, {"query_embedding": list(np.array([0.5], dtype=np.float32))}) == (
+        QueryCache.make_key("index", 0, {"query_embedding": [0.5]})
+    )
+
+
+@pytest.mark.parametrize(
+    "custom_query, expected",
+    [
+        ({"query": {"bool": {"must": {"match": {"content": "$query"}}, "filter": "$filters"}}}, True),
+        ({"query": {"function_score": {"query": {"match_all": {}}, "random_score": {}}}}, False),
+        ({"query": {"bool": {"filter": [{"range": {"meta.date": {"gte": "now-1d/d"}}}]}}}, False),
+    ],
+)
+def test_is_deterministic_query(custom_query, expected):
+    assert is_deterministic_query(custom_query) is expected